@@ -1,27 +1,48 @@
 from fastmcp import FastMCP
-from src.models import Document, AnalysisResult
-from src.analyzer import analyze_sentiment, extract_keywords, calculate_readability, get_basic_stats
+from src.models import Document, AnalysisResult, SimilarDocument, SentimentAgreement, SentimentBatchResult
+from src.analyzer import (
+    analyze_sentiment,
+    analyze_sentiment_batch,
+    sentiment_agreement,
+    extract_keywords,
+    calculate_readability,
+    get_basic_stats
+)
 from src.storage import DocumentStorage
 from typing import List, Dict
 
 # Initialize MCP and document storage
 app = FastMCP("Document MCP")
 storage = DocumentStorage()
+# Analysis results keyed by document ID
+analysis_cache: Dict[str, AnalysisResult] = {}
 
 @app.tool()
 async def analyze_document(document_id: str) -> AnalysisResult:
-    """Perform full analysis on a document."""
+    """Perform full analysis on a document.
+
+    For a near-duplicate of an already analyzed document, sentiment and
+    readability are reused from the original as an approximation; keywords
+    and word/sentence counts are always computed from the document itself.
+    """
     document = storage.get_document(document_id)
     if not document:
         raise ValueError(f"Document with ID {document_id} not found")
 
-    # Perform analysis
-    sentiment = analyze_sentiment(document.content)
+    if document_id in analysis_cache:
+        return analysis_cache[document_id]
+
+    # Perform analysis, reusing the expensive whole-text scores of the original
+    original = analysis_cache.get(storage.get_canonical_id(document_id))
+    if original:
+        sentiment, readability = original.sentiment, original.readability_score
+    else:
+        sentiment = analyze_sentiment(document.content)
+        readability = calculate_readability(document.content)
     keywords = await extract_keywords_tool(document.content)
-    readability = calculate_readability(document.content)
     word_count, sentence_count = get_basic_stats(document.content)
 
-    return AnalysisResult(
+    result = AnalysisResult(
         sentiment=sentiment,
         keywords=keywords,
         readability_score=readability,
@@ -29,11 +50,22 @@ async def analyze_document(document_id: str) -> AnalysisResult:
         sentence_count=sentence_count,
         document_id=document_id
     )
+    analysis_cache[document_id] = result
+    return result
 
 @app.tool()
-async def get_sentiment(text: str) -> str:
-    """Get sentiment analysis for any text."""
-    return analyze_sentiment(text)
+async def get_sentiment(text: str, engine: str = "textblob") -> str:
+    """Get sentiment analysis for any text using the "textblob" or fast "lexicon" engine."""
+    return analyze_sentiment(text, engine)
+
+@app.tool()
+async def get_sentiment_batch(texts: List[str], engine: str = "lexicon", compare: bool = False) -> SentimentBatchResult:
+    """Get sentiment labels for many texts, optionally with an agreement and throughput report against TextBlob."""
+    return SentimentBatchResult(
+        engine=engine,
+        labels=analyze_sentiment_batch(texts, engine),
+        agreement=SentimentAgreement(**sentiment_agreement(texts)) if compare else None
+    )
 
 @app.tool()
 async def extract_keywords_tool(text: str, limit: int = 10) -> List[str]:
@@ -41,14 +73,19 @@ async def extract_keywords_tool(text: str, limit: int = 10) -> List[str]:
     return extract_keywords(text, limit)
 
 @app.tool()
-async def add_document(title: str, content: str, metadata: Dict[str, str] = {}) -> str:
-    """Add a new document to the storage."""
-    return storage.add_document(title, content, metadata)
+async def add_document(title: str, content: str, metadata: Dict[str, str] = {}, dedupe: bool = False) -> str:
+    """Add a new document to the storage, optionally returning the ID of an existing near-duplicate."""
+    return storage.add_document(title, content, metadata, dedupe=dedupe)
 
 @app.tool()
 async def search_documents(query: str) -> List[Document]:
     """Search for documents by content."""
     return storage.search_documents(query)
 
+@app.tool()
+async def find_similar_documents(document_id: str, threshold: float = 0.8) -> List[SimilarDocument]:
+    """Find stored documents that are near-duplicates of the given document (threshold >= ~0.42)."""
+    return storage.find_similar_documents(document_id, threshold)
+
 if __name__ == "__main__":
     app.run()
@@ -4,18 +4,19 @@ from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 from nltk.probability import FreqDist
 from readability import Readability
-from typing import List
+from typing import Dict, List
+import time
+from .sentiment import lexicon_polarity
 
 # Download required NLTK data
 nltk.download('punkt')
 nltk.download('stopwords')
 nltk.download('averaged_perceptron_tagger')
 
-def analyze_sentiment(text: str) -> str:
-    """Analyze the sentiment of given text."""
-    blob = TextBlob(text)
-    polarity = blob.sentiment.polarity
-    
+SENTIMENT_ENGINES = ("textblob", "lexicon")
+
+def _sentiment_label(polarity: float) -> str:
+    """Map a polarity score to a sentiment label."""
     if polarity > 0.1:
         return "positive"
     elif polarity < -0.1:
@@ -23,6 +24,42 @@ def analyze_sentiment(text: str) -> str:
     else:
         return "neutral"
 
+def analyze_sentiment(text: str, engine: str = "textblob") -> str:
+    """Analyze the sentiment of given text with the selected engine."""
+    if engine == "textblob":
+        return _sentiment_label(TextBlob(text).sentiment.polarity)
+    elif engine == "lexicon":
+        return _sentiment_label(lexicon_polarity(text))
+    raise ValueError(f"Unknown sentiment engine {engine}, expected one of {SENTIMENT_ENGINES}")
+
+def analyze_sentiment_batch(texts: List[str], engine: str = "lexicon") -> List[str]:
+    """Analyze the sentiment of many texts in one call."""
+    return [analyze_sentiment(text, engine) for text in texts]
+
+def sentiment_agreement(texts: List[str]) -> Dict:
+    """Compare lexicon labels with TextBlob labels and time both engines."""
+    start = time.perf_counter()
+    lexicon_labels = analyze_sentiment_batch(texts, "lexicon")
+    lexicon_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    textblob_labels = analyze_sentiment_batch(texts, "textblob")
+    textblob_seconds = time.perf_counter() - start
+
+    labels = ("positive", "negative", "neutral")
+    confusion = {expected: {actual: 0 for actual in labels} for expected in labels}
+    for expected, actual in zip(textblob_labels, lexicon_labels):
+        confusion[expected][actual] += 1
+    matches = sum(confusion[label][label] for label in labels)
+
+    return {
+        "total": len(texts),
+        "agreement_rate": round(matches / len(texts), 4) if texts else 1.0,
+        "confusion": confusion,
+        "lexicon_texts_per_second": round(len(texts) / lexicon_seconds, 1) if lexicon_seconds else 0.0,
+        "textblob_texts_per_second": round(len(texts) / textblob_seconds, 1) if textblob_seconds else 0.0
+    }
+
 def extract_keywords(text: str, limit: int = 10) -> List[str]:
     """Extract top keywords from the text."""
     # Tokenize and convert to lower case
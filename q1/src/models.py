@@ -15,4 +15,21 @@ class AnalysisResult(BaseModel):
     readability_score: float
     word_count: int
     sentence_count: int
-    document_id: Optional[str] = None 
\ No newline at end of file
+    document_id: Optional[str] = None
+
+class SimilarDocument(BaseModel):
+    document_id: str
+    title: str
+    similarity: float
+
+class SentimentAgreement(BaseModel):
+    total: int
+    agreement_rate: float
+    confusion: Dict[str, Dict[str, int]]
+    lexicon_texts_per_second: float
+    textblob_texts_per_second: float
+
+class SentimentBatchResult(BaseModel):
+    engine: str
+    labels: List[str]
+    agreement: Optional[SentimentAgreement] = None
@@ -0,0 +1,124 @@
+import os
+import re
+import xml.etree.ElementTree as ElementTree
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import textblob
+from textblob._text import EMOTICONS
+
+# Emoticon (lower case) -> polarity; "(!)" marks sarcasm and scores neutral
+_EMOTICONS = {
+    emoticon.lower(): polarity
+    for (_, polarity), emoticons in EMOTICONS.items()
+    for emoticon in emoticons
+}
+_EMOTICONS["(!)"] = 0.0
+# Same contraction split as pattern's tokenizer; apostrophes then end a token
+_CONTRACTION_RE = re.compile(r"n't")
+_TOKEN_RE = re.compile(
+    r"(?<!\S)(?:%s)(?!\S)" % "|".join(map(re.escape, sorted(_EMOTICONS, key=len, reverse=True)))
+    + r"|[^\s.,;:!?()\[\]{}`'\"@#$^&*+|=~_-][^\s.,;:!?()\[\]{}`'\"]*|!"
+)
+_NEGATIONS = {"no", "not", "never", "n't"}
+_NEGATION_FACTOR = -0.5
+_EXCLAMATION_BOOST = 1.25
+
+# word -> (polarity, intensity, is_modifier)
+Lexicon = Dict[str, Tuple[float, float, bool]]
+
+
+def _average(values: List[float]) -> float:
+    return sum(values) / len(values)
+
+
+@lru_cache(maxsize=1)
+def load_lexicon() -> Lexicon:
+    """Compile TextBlob's sentiment lexicon into a word lookup table.
+
+    Scores are averaged per part-of-speech tag first and then across tags,
+    words with an adverb sense act as modifiers, and adjectives get a derived
+    "-ly" adverb, all as in TextBlob's pattern analyzer.
+    """
+    path = os.path.join(os.path.dirname(textblob.__file__), "en", "en-sentiment.xml")
+    senses: Dict[str, Dict[str, List[Tuple[float, float]]]] = {}
+    for entry in ElementTree.parse(path).getroot().findall("word"):
+        form = entry.get("form")
+        if form:
+            senses.setdefault(form, {}).setdefault(entry.get("pos"), []).append(
+                (float(entry.get("polarity", 0.0)), float(entry.get("intensity", 1.0)))
+            )
+
+    lexicon: Lexicon = {}
+    adjectives: List[Tuple[str, Tuple[float, float]]] = []
+    for form, by_pos in senses.items():
+        per_pos = {
+            pos: (_average([p for p, _ in scores]), _average([i for _, i in scores]))
+            for pos, scores in by_pos.items()
+        }
+        polarity = _average([p for p, _ in per_pos.values()])
+        intensity = _average([i for _, i in per_pos.values()])
+        lexicon[form] = (polarity, intensity, "RB" in per_pos)
+        if "JJ" in per_pos:
+            adjectives.append((form, per_pos["JJ"]))
+
+    # Map "terrible" to adverb "terribly"
+    for form, (polarity, intensity) in adjectives:
+        if form.endswith("y"):
+            form = form[:-1] + "i"
+        if form.endswith("le"):
+            form = form[:-2]
+        lexicon[form + "ly"] = (polarity, intensity, True)
+    return lexicon
+
+
+def lexicon_polarity(text: str) -> float:
+    """Score text polarity in [-1, 1] from the compiled lexicon.
+
+    Follows TextBlob's pattern analyzer: a modifier scales the next known word,
+    a negation flips and halves it, and both are dropped at the first unknown
+    word that is long enough (over one character for a negation, two for a
+    modifier). A modifier with no known word after it keeps its own score,
+    "!" boosts the previous score and emoticons are scored as words.
+    """
+    lexicon = load_lexicon()
+    tokens = _TOKEN_RE.findall(_CONTRACTION_RE.sub(" n't", text.lower()))
+    # Each assessment is [polarity, intensity, negated]
+    assessments: List[list] = []
+    modifier = None
+    negated = False
+    for token in tokens:
+        entry = lexicon.get(token)
+        if entry is not None:
+            polarity, intensity, is_modifier = entry
+            if modifier is None:
+                assessments.append([polarity, intensity, False])
+            else:
+                previous = assessments[-1]
+                previous[0] = max(-1.0, min(polarity * previous[1], 1.0))
+                previous[1] = intensity
+            if negated:
+                assessments[-1][1] = 1.0 / assessments[-1][1]
+                assessments[-1][2] = True
+            modifier = token if is_modifier else None
+            negated = token in _NEGATIONS
+            continue
+
+        if token in _NEGATIONS:
+            negated = True
+        elif negated and len(token) > 1:
+            negated = False
+        if negated and modifier is not None and modifier.endswith("ly"):
+            # "really not good": the negation attaches to the modifier
+            assessments[-1][2] = True
+            negated = False
+        elif modifier is not None and len(token) > 2:
+            modifier = None
+        if token == "!" and assessments:
+            assessments[-1][0] = max(-1.0, min(assessments[-1][0] * _EXCLAMATION_BOOST, 1.0))
+        if token in _EMOTICONS:
+            assessments.append([_EMOTICONS[token], 1.0, False])
+
+    scores = [polarity * _NEGATION_FACTOR if negative else polarity
+              for polarity, _, negative in assessments]
+    return sum(scores) / len(scores) if scores else 0.0
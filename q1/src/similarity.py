@@ -0,0 +1,90 @@
+import hashlib
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+# Added per borrowed position so densified values never collide with real ones
+_DENSIFY_OFFSET = 1 << 64
+
+
+def shingles(text: str, size: int = 3) -> Set[str]:
+    """Split text into a set of word n-gram shingles."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """Compute fixed-length MinHash signatures for shingle sets.
+
+    Uses one-permutation hashing: each shingle is hashed once and the hash
+    picks one of num_perm bins, which keeps its minimum. Empty bins borrow the
+    next non-empty bin's value (rotation densification), so signatures stay
+    comparable slot by slot. Cost is linear in the number of shingles.
+    """
+
+    def __init__(self, num_perm: int = 128):
+        self.num_perm = num_perm
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """Return the MinHash signature of text, or None if it has no words."""
+        tokens = shingles(text)
+        if not tokens:
+            return None
+        bins: List[Optional[int]] = [None] * self.num_perm
+        for token in tokens:
+            value = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+            slot, value = value % self.num_perm, value // self.num_perm
+            if bins[slot] is None or value < bins[slot]:
+                bins[slot] = value
+
+        signature = list(bins)
+        for slot, value in enumerate(bins):
+            if value is None:
+                offset = 1
+                while bins[(slot + offset) % self.num_perm] is None:
+                    offset += 1
+                signature[slot] = bins[(slot + offset) % self.num_perm] + offset * _DENSIFY_OFFSET
+        return tuple(signature)
+
+
+def estimate_similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """Estimate the Jaccard similarity of two signatures."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+class MinHashLSH:
+    """Banded locality-sensitive hash index over MinHash signatures."""
+
+    def __init__(self, num_perm: int = 128, bands: int = 32):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        # Similarity at which a pair becomes a candidate with ~50% probability
+        self.threshold = (1 / bands) ** (1 / self.rows)
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [defaultdict(set) for _ in range(bands)]
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [signature[i * self.rows:(i + 1) * self.rows] for i in range(self.bands)]
+
+    def insert(self, key: str, signature: Tuple[int, ...]) -> None:
+        """Index a signature under the given key."""
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            bucket[band].add(key)
+
+    def remove(self, key: str, signature: Tuple[int, ...]) -> None:
+        """Remove a previously inserted key."""
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            bucket[band].discard(key)
+            if not bucket[band]:
+                del bucket[band]
+
+    def query(self, signature: Tuple[int, ...]) -> Set[str]:
+        """Return keys sharing at least one band with the signature."""
+        candidates: Set[str] = set()
+        for bucket, band in zip(self._buckets, self._band_keys(signature)):
+            candidates |= bucket.get(band, set())
+        return candidates
@@ -1,15 +1,35 @@
 from datetime import datetime
 import uuid
-from typing import List, Optional, Dict
-from .models import Document
+from typing import List, Optional, Dict, Tuple
+from .models import Document, SimilarDocument
+from .similarity import MinHasher, MinHashLSH, estimate_similarity
 
 class DocumentStorage:
-    def __init__(self):
+    def __init__(self, duplicate_threshold: float = 0.9):
         self.documents: Dict[str, Document] = {}
+        self.duplicate_threshold = duplicate_threshold
+        self.duplicate_of: Dict[str, str] = {}
+        self._hasher = MinHasher()
+        self._lsh = MinHashLSH(num_perm=self._hasher.num_perm)
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
         self._initialize_sample_documents()
 
-    def add_document(self, title: str, content: str, metadata: Optional[Dict[str, str]] = None) -> str:
-        """Add a new document and return its ID."""
+    def add_document(self, title: str, content: str, metadata: Optional[Dict[str, str]] = None,
+                     dedupe: bool = False) -> str:
+        """Add a new document and return its ID.
+
+        With dedupe=True, a near-duplicate of an existing document is not stored
+        and the existing document's ID is returned instead.
+        """
+        signature = self._hasher.signature(content)
+        original_id = None
+        if signature is not None:
+            matches = self._match_signature(signature, self.duplicate_threshold)
+            if matches:
+                original_id = matches[0][0]
+                if dedupe:
+                    return original_id
+
         doc_id = str(uuid.uuid4())
         self.documents[doc_id] = Document(
             id=doc_id,
@@ -18,12 +38,57 @@ class DocumentStorage:
             created_at=datetime.now(),
             metadata=metadata or {}
         )
+        if signature is not None:
+            self._signatures[doc_id] = signature
+            self._lsh.insert(doc_id, signature)
+        if original_id is not None:
+            self.duplicate_of[doc_id] = self.get_canonical_id(original_id)
         return doc_id
 
     def get_document(self, doc_id: str) -> Optional[Document]:
         """Get a document by ID."""
         return self.documents.get(doc_id)
 
+    def get_canonical_id(self, doc_id: str) -> str:
+        """Get the ID of the first stored document this one duplicates."""
+        return self.duplicate_of.get(doc_id, doc_id)
+
+    def find_similar_documents(self, doc_id: str, threshold: float = 0.8) -> List[SimilarDocument]:
+        """Find documents whose estimated similarity to doc_id is at least threshold.
+
+        Only LSH candidates are compared, so threshold must be at least the LSH
+        threshold (about 0.42); recall is ~87% at 0.5 and ~99% from 0.6 up.
+        """
+        if doc_id not in self.documents:
+            raise ValueError(f"Document with ID {doc_id} not found")
+        if threshold < self._lsh.threshold:
+            raise ValueError(
+                f"threshold must be at least {self._lsh.threshold:.2f}; "
+                "lower similarities are not indexed"
+            )
+        signature = self._signatures.get(doc_id)
+        if signature is None:
+            return []
+        return [
+            SimilarDocument(
+                document_id=other_id,
+                title=self.documents[other_id].title,
+                similarity=round(similarity, 3)
+            )
+            for other_id, similarity in self._match_signature(signature, threshold)
+            if other_id != doc_id
+        ]
+
+    def _match_signature(self, signature: Tuple[int, ...], threshold: float) -> List[Tuple[str, float]]:
+        """Return (doc_id, similarity) pairs from LSH candidates, most similar first."""
+        matches = []
+        for candidate_id in self._lsh.query(signature):
+            similarity = estimate_similarity(signature, self._signatures[candidate_id])
+            if similarity >= threshold:
+                matches.append((candidate_id, similarity))
+        matches.sort(key=lambda match: (-match[1], self.documents[match[0]].created_at))
+        return matches
+
     def search_documents(self, query: str) -> List[Document]:
         """Search documents by content."""
         query = query.lower()
@@ -0,0 +1,65 @@
+import pytest
+
+from src.analyzer import analyze_sentiment, analyze_sentiment_batch, sentiment_agreement
+
+NEGATION_AND_INTENSIFIER_CASES = [
+    "not good",
+    "not bad",
+    "very good",
+    "very bad",
+    "really not good",
+    "I don't know why, but this is great",
+    "don't know, but great",
+    "never a dull moment",
+    "not a good idea",
+    "extremely",
+    "terribly slow service",
+]
+
+CORPUS = NEGATION_AND_INTENSIFIER_CASES + [
+    "I love this product, it works perfectly!",
+    "Absolutely terrible customer service.",
+    "The package arrived on Tuesday.",
+    "Best purchase I have made all year :)",
+    "Meh, it's okay I guess.",
+    "Worst experience ever :(",
+    "The food was cold and the staff were rude.",
+    "What a wonderful surprise!!!",
+    "It is neither good nor bad.",
+    "The update broke everything (!)",
+    "Pretty happy with the results so far.",
+    "I am not sure how I feel about this.",
+    "The movie was boring and far too long.",
+    "Such a beautiful, sunny day <3",
+    "Shipping was slow but the quality is excellent.",
+    "Nothing special.",
+    "The instructions were clear and easy to follow.",
+    "Honestly disappointed with the battery life.",
+    "Great value for money",
+    "This is the second time it has failed.",
+]
+
+MIN_AGREEMENT = 0.95
+
+
+@pytest.mark.parametrize("text", NEGATION_AND_INTENSIFIER_CASES)
+def test_lexicon_matches_textblob_on_negation_and_intensifiers(text):
+    assert analyze_sentiment(text, "lexicon") == analyze_sentiment(text, "textblob")
+
+
+def test_agreement_report():
+    report = sentiment_agreement(CORPUS)
+
+    assert report["total"] == len(CORPUS)
+    assert report["agreement_rate"] >= MIN_AGREEMENT
+    assert sum(sum(row.values()) for row in report["confusion"].values()) == len(CORPUS)
+    assert report["lexicon_texts_per_second"] > report["textblob_texts_per_second"]
+
+
+def test_batch_labels_match_single_calls():
+    assert analyze_sentiment_batch(CORPUS) == [analyze_sentiment(text, "lexicon") for text in CORPUS]
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        analyze_sentiment("good", "fancy")
@@ -0,0 +1,59 @@
+import random
+import time
+
+import pytest
+
+from src.similarity import MinHasher, estimate_similarity, shingles
+from src.storage import DocumentStorage
+
+rng = random.Random(0)
+VOCAB = [f"word{i}" for i in range(2000)]
+BASE = [rng.choice(VOCAB) for _ in range(400)]
+
+
+def variant(words, changed):
+    """Copy words with the first `changed` positions replaced."""
+    return [f"other{i}" if i < changed else word for i, word in enumerate(words)]
+
+
+def test_signature_estimates_jaccard():
+    hasher = MinHasher()
+    other = variant(BASE, 40)
+    a, b = shingles(" ".join(BASE)), shingles(" ".join(other))
+    jaccard = len(a & b) / len(a | b)
+    estimate = estimate_similarity(hasher.signature(" ".join(BASE)), hasher.signature(" ".join(other)))
+    assert abs(estimate - jaccard) < 0.15
+
+
+def test_signature_of_long_document_is_cheap():
+    text = " ".join(rng.choice(VOCAB) for _ in range(5000))
+    start = time.perf_counter()
+    MinHasher().signature(text)
+    assert time.perf_counter() - start < 0.1
+
+
+def test_dedupe_returns_existing_id():
+    storage = DocumentStorage()
+    original = storage.add_document("Original", " ".join(BASE))
+    assert storage.add_document("Copy", " ".join(variant(BASE, 2)), dedupe=True) == original
+
+    duplicate = storage.add_document("Copy", " ".join(variant(BASE, 2)))
+    assert duplicate != original
+    assert storage.get_canonical_id(duplicate) == original
+
+
+def test_find_similar_documents():
+    storage = DocumentStorage()
+    original = storage.add_document("Original", " ".join(BASE))
+    near = storage.add_document("Near", " ".join(variant(BASE, 10)))
+    storage.add_document("Unrelated", " ".join(rng.choice(VOCAB) for _ in range(400)))
+
+    similar = storage.find_similar_documents(original, threshold=0.8)
+    assert [match.document_id for match in similar] == [near]
+
+
+def test_find_similar_documents_rejects_unindexed_threshold():
+    storage = DocumentStorage()
+    doc_id = storage.add_document("Original", " ".join(BASE))
+    with pytest.raises(ValueError):
+        storage.find_similar_documents(doc_id, threshold=0.3)
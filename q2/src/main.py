@@ -1,5 +1,6 @@
 from fastmcp import FastMCP
-from tools.meeting_tools import create_meeting
+from tools.helper import warmup, data_manager
+from tools.meeting_tools import create_meeting, generate_agenda_suggestions
 from tools.scheduling_tools import find_optimal_slots, detect_scheduling_conflicts
 from tools.analytics_tools import (
     analyze_meeting_patterns,
@@ -52,4 +53,6 @@ def mcp_optimize_schedule(user_id: str) -> dict:
     return optimize_meeting_schedule(user_id)
 
 if __name__ == "__main__":
+    warmup()
+    data_manager.start_watching()
     app.run() 
\ No newline at end of file
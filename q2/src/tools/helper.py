@@ -1,38 +1,178 @@
 import json
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any
 import pytz
 from dateutil import parser
-import google.generativeai as genai
 from pathlib import Path
+import threading
+import logging
 import os
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-# Configure Gemini AI
-genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
-model = genai.GenerativeModel('gemini-pro')
+# Gemini model and data manager are created on first use (see get_model /
+# get_data_manager) so importing the tools package has no side effects.
+_model = None
+_data_manager = None
+_init_lock = threading.Lock()
+
+def get_model():
+    """Get the Gemini model, configuring the SDK on first call"""
+    global _model
+    if _model is None:
+        with _init_lock:
+            if _model is None:
+                import google.generativeai as genai
+                from dotenv import load_dotenv
+                load_dotenv()
+                genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
+                _model = genai.GenerativeModel('gemini-pro')
+    return _model
+
+def _diff_records(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Compare two id -> record mappings and list added, removed and updated ids"""
+    return {
+        "added": [key for key in new if key not in old],
+        "removed": [key for key in old if key not in new],
+        "updated": [key for key in new if key in old and new[key] != old[key]]
+    }
+
+def _apply_diff(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]],
+                diff: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
+    """Build a new mapping from old, reusing every record the diff leaves untouched"""
+    merged = dict(old)
+    for key in diff["removed"]:
+        del merged[key]
+    for key in diff["updated"] + diff["added"]:
+        merged[key] = new[key]
+    return merged
 
 class MeetingDataManager:
-    def __init__(self):
+    def __init__(self, data_file: Path = None):
         # Get the project root directory (2 levels up from this file)
         project_root = Path(__file__).parent.parent.parent
-        self.data_file = project_root / "data" / "sample_content.json"
+        self.data_file = Path(data_file) if data_file else project_root / "data" / "sample_content.json"
+        self._lock = threading.RLock()
+        self._participant_locks: Dict[str, threading.Lock] = {}
+        self._file_stamp = None
+        self._watcher = None
+        self._stop_watching = threading.Event()
         self.load_data()
 
+    def _read_file_stamp(self):
+        """Return (mtime_ns, size) of the data file, or None if it is missing"""
+        try:
+            stat = os.stat(self.data_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def load_data(self) -> None:
         """Load meeting and user data from JSON file"""
-        with open(self.data_file, 'r') as f:
-            self.data = json.load(f)
-            self.users = {user['user_id']: user for user in self.data['users']}
-            self.meetings = {meeting['meeting_id']: meeting for meeting in self.data['meetings']}
+        with self._lock:
+            stamp = self._read_file_stamp()
+            with open(self.data_file, 'r') as f:
+                self.data = json.load(f)
+                self.users = {user['user_id']: user for user in self.data['users']}
+                self.meetings = {meeting['meeting_id']: meeting for meeting in self.data['meetings']}
+            self._file_stamp = stamp
 
     def save_data(self) -> None:
         """Save current data back to JSON file"""
-        with open(self.data_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        with self._lock:
+            with open(self.data_file, 'w') as f:
+                json.dump(self.data, f, indent=2)
+            # Our own write must not look like an external change to the watcher
+            self._file_stamp = self._read_file_stamp()
+
+    @contextmanager
+    def lock_participants(self, user_ids: Iterable[str]) -> Iterator[None]:
+        """Hold the booking locks of all given users.
+
+        Locks are taken in sorted order so overlapping bookings cannot deadlock,
+        while bookings with disjoint participants proceed in parallel.
+        """
+        with self._lock:
+            locks = [self._participant_locks.setdefault(user_id, threading.Lock())
+                     for user_id in sorted(set(user_ids))]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def add_meeting(self, meeting: Dict[str, Any]) -> None:
+        """Add a meeting and persist it.
+
+        New collections are swapped in rather than mutated so concurrent readers
+        never iterate a dict or list while it changes size.
+        """
+        with self._lock:
+            self.data = {**self.data, "meetings": self.data["meetings"] + [meeting]}
+            self.meetings = {**self.meetings, meeting["meeting_id"]: meeting}
+            self.save_data()
+
+    def reload_if_changed(self) -> Dict[str, Dict[str, List[str]]]:
+        """Apply external changes to the data file incrementally.
+
+        Returns the per-collection diff that was applied, or None when the file
+        is unchanged or cannot be used yet (mid-write, replaced by rename, or
+        missing users/meetings/IDs); such a file is retried on the next call.
+        Readers keep using the previous users/meetings dicts until the new ones
+        are swapped in.
+        """
+        with self._lock:
+            stamp = self._read_file_stamp()
+            if stamp is None or stamp == self._file_stamp:
+                return None
+            try:
+                with open(self.data_file, 'r') as f:
+                    new_data = json.load(f)
+                new_users = {user['user_id']: user for user in new_data['users']}
+                new_meetings = {meeting['meeting_id']: meeting for meeting in new_data['meetings']}
+            except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+                logger.warning("Skipping reload of %s: %r", self.data_file, e)
+                return None
+
+            changes = {
+                "users": _diff_records(self.users, new_users),
+                "meetings": _diff_records(self.meetings, new_meetings)
+            }
+            users = _apply_diff(self.users, new_users, changes["users"])
+            meetings = _apply_diff(self.meetings, new_meetings, changes["meetings"])
+            new_data['users'] = list(users.values())
+            new_data['meetings'] = list(meetings.values())
+
+            self.data, self.users, self.meetings = new_data, users, meetings
+            self._file_stamp = stamp
+            return changes
+
+    def start_watching(self, interval: float = 2.0) -> None:
+        """Poll the data file in a background thread and hot reload it on change"""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop_watching.clear()
+
+        def watch():
+            while not self._stop_watching.wait(interval):
+                try:
+                    self.reload_if_changed()
+                except Exception:
+                    # One bad poll must not end hot reload; retry on the next tick
+                    logger.exception("Hot reload of %s failed", self.data_file)
+
+        self._watcher = threading.Thread(target=watch, name="meeting-data-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the background file watcher"""
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
 
     def get_user(self, user_id: str) -> Dict[str, Any]:
         """Get user details by ID"""
@@ -57,8 +197,30 @@ def convert_to_utc(time_str: str, timezone: str) -> datetime:
 
 def get_ai_suggestions(prompt: str) -> str:
     """Get AI-powered suggestions using Gemini"""
-    response = model.generate_content(prompt)
+    response = get_model().generate_content(prompt)
     return response.text
 
-# Initialize global data manager
-data_manager = MeetingDataManager() 
\ No newline at end of file
+def get_data_manager() -> MeetingDataManager:
+    """Get the global data manager, loading the data file on first call"""
+    global _data_manager
+    if _data_manager is None:
+        with _init_lock:
+            if _data_manager is None:
+                _data_manager = MeetingDataManager()
+    return _data_manager
+
+class _LazyDataManager:
+    """Module-level stand-in that forwards to the real data manager on first use"""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_data_manager(), name)
+
+def warmup(load_model: bool = True) -> None:
+    """Eagerly initialize the data manager (and optionally the Gemini model)"""
+    get_data_manager()
+    if load_model:
+        get_model()
+
+# Global data manager, initialized lazily on first attribute access
+data_manager = _LazyDataManager()
+ 
\ No newline at end of file
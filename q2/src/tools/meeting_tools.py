@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 import uuid
+import pytz
 from .helper import data_manager, convert_to_utc, get_ai_suggestions
 from .scheduling_tools import find_optimal_slots
 
@@ -14,39 +15,42 @@ def create_meeting(title: str, participants: List[str], duration: int, preferenc
     # Generate meeting ID
     meeting_id = f"m{str(uuid.uuid4())[:8]}"
 
-    # Get optimal time slot based on preferences
-    time_slots = find_optimal_slots(participants, duration, {
-        "start": datetime.now().isoformat(),
-        "end": (datetime.now() + timedelta(days=7)).isoformat()
-    })
+    # Generate AI-powered agenda suggestions before taking any booking locks
+    suggested_agenda = generate_agenda_suggestions(title, participants)
 
-    if not time_slots:
-        raise ValueError("No suitable time slots found for all participants")
+    # Hold participant locks from slot search until the meeting is saved so
+    # concurrent bookings cannot claim the same slot for a shared participant
+    with data_manager.lock_participants(participants):
+        # Get optimal time slot based on preferences
+        # Search in UTC so slots compare with the timezone-aware stored meetings
+        now = datetime.now(pytz.UTC)
+        time_slots = find_optimal_slots(participants, duration, {
+            "start": now.isoformat(),
+            "end": (now + timedelta(days=7)).isoformat()
+        })
 
-    # Use the first optimal slot
-    start_time = time_slots[0]["start"]
-    end_time = time_slots[0]["end"]
+        if not time_slots:
+            raise ValueError("No suitable time slots found for all participants")
 
-    # Generate AI-powered agenda suggestions
-    suggested_agenda = generate_agenda_suggestions(title, participants)
+        # Use the first optimal slot
+        start_time = time_slots[0]["start"]
+        end_time = time_slots[0]["end"]
 
-    # Create meeting object
-    meeting = {
-        "meeting_id": meeting_id,
-        "title": title,
-        "participants": participants,
-        "start_time": start_time,
-        "end_time": end_time,
-        "agenda": suggested_agenda,
-        "location": "Virtual",  # Default to virtual
-        "notes": "",
-        "effectiveness_score": None  # Will be updated after the meeting
-    }
+        # Create meeting object
+        meeting = {
+            "meeting_id": meeting_id,
+            "title": title,
+            "participants": participants,
+            "start_time": start_time,
+            "end_time": end_time,
+            "agenda": suggested_agenda,
+            "location": "Virtual",  # Default to virtual
+            "notes": "",
+            "effectiveness_score": None  # Will be updated after the meeting
+        }
 
-    # Add to data and save
-    data_manager.data["meetings"].append(meeting)
-    data_manager.meetings[meeting_id] = meeting
-    data_manager.save_data()
+        # Add to data and save
+        data_manager.add_meeting(meeting)
 
     return meeting
 
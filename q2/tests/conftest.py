@@ -0,0 +1,19 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Tools are imported as the top-level `tools` package, as src/main.py does
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+DATA_FILE = SRC_DIR.parent / "data" / "sample_content.json"
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    """A private copy of the sample data that tests may rewrite"""
+    path = tmp_path / "sample_content.json"
+    shutil.copy(DATA_FILE, path)
+    return path
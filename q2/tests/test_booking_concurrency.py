@@ -0,0 +1,76 @@
+import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import combinations
+
+import pytest
+
+import tools.helper as helper
+import tools.meeting_tools as meeting_tools
+from tools.helper import MeetingDataManager
+from tools.meeting_tools import create_meeting
+
+# Users whose working hours overlap pairwise, so every pair has free slots
+POOL = ["u1", "u3", "u7", "u10"]
+BOOKINGS = 40
+
+
+@pytest.fixture
+def manager(data_file, monkeypatch):
+    manager = MeetingDataManager(data_file)
+    monkeypatch.setattr(helper, "_data_manager", manager)
+    monkeypatch.setattr(meeting_tools, "get_ai_suggestions", lambda prompt: "Intro, Discussion, Next steps")
+    return manager
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    """Switch threads as often as possible to surface races"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def book(participants):
+    try:
+        return create_meeting("Sync", participants, 30)
+    except ValueError:
+        # The pair's week is fully booked
+        return None
+
+
+def test_concurrent_bookings_never_double_book(manager, frequent_thread_switches):
+    rng = random.Random(0)
+    requests = [rng.sample(POOL, 2) for _ in range(BOOKINGS)]
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        booked = [meeting for meeting in pool.map(book, requests) if meeting]
+
+    assert len(booked) > BOOKINGS // 2
+    assert len(manager.data["meetings"]) == len(manager.meetings)
+    for user_id in POOL:
+        own = [meeting for meeting in booked if user_id in meeting["participants"]]
+        for first, second in combinations(own, 2):
+            overlaps = (datetime.fromisoformat(first["start_time"]) < datetime.fromisoformat(second["end_time"])
+                        and datetime.fromisoformat(second["start_time"]) < datetime.fromisoformat(first["end_time"]))
+            assert not overlaps, f"{user_id} double booked: {first['meeting_id']} and {second['meeting_id']}"
+
+
+def test_disjoint_bookings_run_in_parallel(manager, monkeypatch):
+    # Both bookings must be inside slot search at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    find_optimal_slots = meeting_tools.find_optimal_slots
+
+    def find_slots_together(*args):
+        barrier.wait()
+        return find_optimal_slots(*args)
+
+    monkeypatch.setattr(meeting_tools, "find_optimal_slots", find_slots_together)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(create_meeting, ["A", "B"], [["u1", "u3"], ["u7", "u10"]], [30, 30]))
+
+    assert [meeting["participants"] for meeting in results] == [["u1", "u3"], ["u7", "u10"]]
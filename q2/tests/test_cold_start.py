@@ -0,0 +1,43 @@
+import json
+import subprocess
+import sys
+
+from conftest import SRC_DIR
+
+# Importing the tools package must stay cheap: no SDK import, no data load
+IMPORT_BUDGET_SECONDS = 1.0
+
+PROBE = """
+import builtins, json, sys, time
+opened = []
+real_open = builtins.open
+def tracking_open(file, *args, **kwargs):
+    opened.append(str(file))
+    return real_open(file, *args, **kwargs)
+builtins.open = tracking_open
+
+start = time.perf_counter()
+import tools
+elapsed = time.perf_counter() - start
+
+builtins.open = real_open
+print(json.dumps({
+    "elapsed": elapsed,
+    "modules": [name for name in ("google.generativeai", "dotenv") if name in sys.modules],
+    "opened": [path for path in opened if path.endswith("sample_content.json")],
+    "data_manager_loaded": tools.helper._data_manager is not None,
+}))
+"""
+
+
+def test_import_tools_is_side_effect_free_and_fast():
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["modules"] == []
+    assert report["opened"] == []
+    assert not report["data_manager_loaded"]
+    assert report["elapsed"] < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,75 @@
+import json
+import os
+import time
+
+import pytest
+
+from tools.helper import MeetingDataManager
+
+
+def write_json(path, data):
+    """Rewrite the file and bump its mtime so the change is always visible"""
+    with open(path, "w") as f:
+        json.dump(data, f)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_reload_applies_incremental_diff(data_file):
+    manager = MeetingDataManager(data_file)
+    untouched = manager.get_meeting("m3")
+    data = json.loads(data_file.read_text())
+    data["meetings"][0]["title"] = "Renamed"
+    removed = data["meetings"].pop(1)["meeting_id"]
+    data["users"].append({"user_id": "u99", "name": "New User"})
+    write_json(data_file, data)
+
+    changes = manager.reload_if_changed()
+
+    assert changes["users"] == {"added": ["u99"], "removed": [], "updated": []}
+    assert changes["meetings"]["removed"] == [removed]
+    assert changes["meetings"]["updated"] == [data["meetings"][0]["meeting_id"]]
+    assert manager.get_meeting(removed) is None
+    assert manager.get_meeting("m3") is untouched
+    assert manager.reload_if_changed() is None
+
+
+def test_own_save_is_not_reloaded(data_file):
+    manager = MeetingDataManager(data_file)
+    manager.save_data()
+    assert manager.reload_if_changed() is None
+
+
+@pytest.mark.parametrize("content", [
+    '{"users": [',
+    '{"users": []}',
+    '{"users": [{"name": "no id"}], "meetings": []}',
+    '[]',
+])
+def test_unusable_file_is_skipped(data_file, content):
+    manager = MeetingDataManager(data_file)
+    users = manager.users
+    data_file.write_text(content)
+    os.utime(data_file, ns=(0, 1))
+
+    assert manager.reload_if_changed() is None
+    assert manager.users is users
+
+
+def test_watcher_survives_bad_file(data_file):
+    manager = MeetingDataManager(data_file)
+    data = json.loads(data_file.read_text())
+    manager.start_watching(interval=0.01)
+    try:
+        write_json(data_file, {"users": []})
+        time.sleep(0.05)
+        assert manager._watcher.is_alive()
+
+        data["users"].append({"user_id": "u99", "name": "New User"})
+        write_json(data_file, data)
+        deadline = time.time() + 2
+        while manager.get_user("u99") is None and time.time() < deadline:
+            time.sleep(0.01)
+        assert manager.get_user("u99") is not None
+    finally:
+        manager.stop_watching()